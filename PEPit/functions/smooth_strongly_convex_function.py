@@ -80,7 +80,11 @@ class SmoothStronglyConvexFunction(Function):
                 if point_i != point_j:
 
                     # Interpolation conditions of smooth strongly convex functions class
-                    self.add_constraint(fi - fj >=
-                                        gj * (xi - xj)
-                                        + 1/(2*self.L) * (gi - gj) ** 2
-                                        + self.mu / (2 * (1 - self.mu / self.L)) * (xi - xj - 1/self.L * (gi - gj))**2)
+                    lower_bound = gj * (xi - xj) + 1/(2*self.L) * (gi - gj) ** 2
+
+                    # The strong convexity term vanishes for smooth convex functions (mu = 0)
+                    if self.mu != 0:
+                        lower_bound = lower_bound + (self.mu / (2 * (1 - self.mu / self.L))
+                                                     * (xi - xj - 1/self.L * (gi - gj))**2)
+
+                    self.add_constraint(fi - fj >= lower_bound)
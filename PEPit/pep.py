@@ -1,5 +1,6 @@
 import numpy as np
 import cvxpy as cp
+import scipy.sparse as sp
 
 from PEPit.point import Point
 from PEPit.expression import Expression
@@ -186,49 +187,70 @@ class PEP(object):
         self.list_of_performance_metrics.append(expression)
 
     @staticmethod
-    def _expression_to_cvxpy(expression, F, G):
+    def _expressions_to_cvxpy(expressions, F, G):
         """
-        Create a cvxpy compatible expression from an :class:`Expression`.
+        Create a single cvxpy compatible vector expression from a list of :class:`Expression` objects.
+
+        The coefficients of all the expressions are stored in 2 sparse matrices (one acting on F, one acting on G),
+        so that cvxpy canonicalizes one vector expression instead of one scalar expression per :class:`Expression`.
 
         Args:
-            expression (Expression): any expression.
+            expressions (list): list of expressions.
             F (cvxpy Variable): a vector representing the function values.
             G (cvxpy Variable): a matrix representing the Gram matrix of all leaf :class:`Point` objects.
 
         Returns:
-            cvxpy_variable (cvxpy Variable): The expression in terms of F and G.
+            cvxpy_variable (cvxpy Variable): The vector of expressions in terms of F and G.
 
         """
-        cvxpy_variable = 0
-        Fweights = np.zeros((Expression.counter,))
-        Gweights = np.zeros((Point.counter, Point.counter))
-
-        # If simple function value, then simply return the right coordinate in F
-        if expression.get_is_leaf():
-            Fweights[expression.counter] += 1
-        # If composite, combine all the cvxpy expression found from leaf expressions
-        else:
-            for key, weight in expression.decomposition_dict.items():
-                # Function values are stored in F
-                if type(key) == Expression:
-                    assert key.get_is_leaf()
-                    Fweights[key.counter] += weight
-                # Inner products are stored in G
-                elif type(key) == tuple:
-                    point1, point2 = key
-                    assert point1.get_is_leaf()
-                    assert point2.get_is_leaf()
-                    Gweights[point1.counter, point2.counter] += weight
-                # Constants are simply constants
-                elif key == 1:
-                    cvxpy_variable += weight
-                # Others don't exist and raise an Exception
-                else:
-                    raise TypeError("Expressions are made of function values, inner products and constants only!")
+        nb_expressions = len(expressions)
+        constants = np.zeros((nb_expressions,))
+
+        # Collect the (row, column, weight) triplets of the 2 sparse matrices.
+        # The Gram matrix G is flattened in column-major order: G[i, j] is stored at column i + Point.counter * j.
+        F_rows, F_cols, F_values = list(), list(), list()
+        G_rows, G_cols, G_values = list(), list(), list()
+
+        for row, expression in enumerate(expressions):
+            # If simple function value, then simply use the right coordinate in F
+            if expression.get_is_leaf():
+                F_rows.append(row)
+                F_cols.append(expression.counter)
+                F_values.append(1)
+            # If composite, combine all the coefficients found from leaf expressions
+            else:
+                for key, weight in expression.decomposition_dict.items():
+                    # Function values are stored in F
+                    if type(key) == Expression:
+                        assert key.get_is_leaf()
+                        F_rows.append(row)
+                        F_cols.append(key.counter)
+                        F_values.append(weight)
+                    # Inner products are stored in G
+                    elif type(key) == tuple:
+                        point1, point2 = key
+                        assert point1.get_is_leaf()
+                        assert point2.get_is_leaf()
+                        G_rows.append(row)
+                        G_cols.append(point1.counter + Point.counter * point2.counter)
+                        G_values.append(weight)
+                    # Constants are simply constants
+                    elif key == 1:
+                        constants[row] += weight
+                    # Others don't exist and raise an Exception
+                    else:
+                        raise TypeError("Expressions are made of function values, inner products and constants only!")
 
-        cvxpy_variable += F @ Fweights + cp.sum(cp.multiply(G, Gweights))
+        # Duplicated (row, column) entries are summed when building the sparse matrices
+        Fweights = sp.csr_matrix((np.array(F_values, dtype=float), (F_rows, F_cols)),
+                                 shape=(nb_expressions, Expression.counter))
+        Gweights = sp.csr_matrix((np.array(G_values, dtype=float), (G_rows, G_cols)),
+                                 shape=(nb_expressions, Point.counter ** 2))
+        vectorized_G = cp.reshape(G, (Point.counter ** 2,), order='F')
 
-        # Return the input expression in a cvxpy variable
+        cvxpy_variable = Fweights @ F + Gweights @ vectorized_G + constants
+
+        # Return the input expressions in a cvxpy variable
         return cvxpy_variable
 
     def solve(self, verbose=1, return_full_cvxpy_problem=False,
@@ -245,6 +267,16 @@ class PEP(object):
             return_full_cvxpy_problem (bool): If True, return the cvxpy Problem object.
                                               If False, return the worst case value only.
                                               Set to False by default.
+                                              Note the constraints of the returned Problem are vector
+                                              constraints, not one scalar constraint per :class:`Constraint`.
+                                              In order, they are: all the performance metrics,
+                                              all the inequality constraints (if any),
+                                              all the equality constraints (if any),
+                                              then one constraint per lmi and the dimension reduction one (if any).
+                                              Within the inequality and equality blocks, the entries follow
+                                              the initial conditions and general constraints,
+                                              then the class constraints of each function,
+                                              in their declaration order.
             dimension_reduction_heuristic (str, optional): An heuristic to reduce the dimension of the solution
                                                            (rank of the Gram matrix).
                                                            Available heuristics are:
@@ -267,10 +299,18 @@ class PEP(object):
             float or cp.Problem: Value of the performance metric of cp.Problem object corresponding to the SDP.
                                  The value only is returned by default.
 
+        Raises:
+            ValueError: if no performance metric was set.
+
         """
         # Set CVXPY verbose to True if verbose mode is at least 2
         kwargs["verbose"] = verbose >= 2
 
+        # The objective of the PEP is the minimum of the performance metrics, hence at least one is needed
+        if not self.list_of_performance_metrics:
+            raise ValueError("No performance metric was set. "
+                             "Please use the method \'set_performance_metric\' before solving the PEP.")
+
         # Create all class constraints
         for function in self.list_of_functions:
             function.add_class_constraints()
@@ -289,46 +329,54 @@ class PEP(object):
         # Defining performance metrics
         # Note maximizing the minimum of all the performance metrics
         # is equivalent to maximize objective which is constraint to be smaller than all the performance metrics.
+        # All performance metrics are gathered in a single vector constraint.
         for performance_metric in self.list_of_performance_metrics:
             assert isinstance(performance_metric, Expression)
-            constraints_list.append(objective <= self._expression_to_cvxpy(performance_metric, F, G))
+        performance_metric_constraint = objective <= self._expressions_to_cvxpy(self.list_of_performance_metrics, F, G)
+        constraints_list.append(performance_metric_constraint)
         if verbose:
             print('(PEPit) Setting up the problem:'
                   ' performance measure is minimum of {} element(s)'.format(len(self.list_of_performance_metrics)))
 
-        # Defining initial conditions and general constraints
-        for condition in self.list_of_constraints:
-            assert isinstance(condition, Constraint)
-            if condition.equality_or_inequality == 'inequality':
-                constraints_list.append(self._expression_to_cvxpy(condition.expression, F, G) <= 0)
-            elif condition.equality_or_inequality == 'equality':
-                constraints_list.append(self._expression_to_cvxpy(condition.expression, F, G) == 0)
+        # Sort initial conditions, general constraints and class constraints into inequalities and equalities.
+        # Each group is then sent to cvxpy as a single vector constraint.
+        list_of_inequalities = list()
+        list_of_equalities = list()
+        list_of_all_constraints = self.list_of_constraints + [constraint for function in self.list_of_functions
+                                                              for constraint in function.list_of_constraints]
+        for constraint in list_of_all_constraints:
+            assert isinstance(constraint, Constraint)
+            if constraint.equality_or_inequality == 'inequality':
+                list_of_inequalities.append(constraint)
+            elif constraint.equality_or_inequality == 'equality':
+                list_of_equalities.append(constraint)
             else:
                 raise ValueError('The attribute \'equality_or_inequality\' of a constraint object'
                                  ' must either be \'equality\' or \'inequality\'.'
-                                 'Got {}'.format(condition.equality_or_inequality))
+                                 'Got {}'.format(constraint.equality_or_inequality))
+
+        # Store each group of constraints with its associated cvxpy constraint to retrieve dual values after solving
+        constraint_blocks = list()
+        if list_of_inequalities:
+            inequality_expressions = [constraint.expression for constraint in list_of_inequalities]
+            constraint_blocks.append((list_of_inequalities,
+                                      self._expressions_to_cvxpy(inequality_expressions, F, G) <= 0))
+        if list_of_equalities:
+            equality_expressions = [constraint.expression for constraint in list_of_equalities]
+            constraint_blocks.append((list_of_equalities,
+                                      self._expressions_to_cvxpy(equality_expressions, F, G) == 0))
+        for _, cvxpy_constraint in constraint_blocks:
+            constraints_list.append(cvxpy_constraint)
+
+        # Print the number of initial conditions, general constraints and class constraints
         if verbose:
             print('(PEPit) Setting up the problem:'
                   ' initial conditions and general constraints ({} constraint(s) added)'.format(len(self.list_of_constraints)))
-
-        # Defining class constraints
-        if verbose:
             print('(PEPit) Setting up the problem:'
                   ' interpolation conditions for {} function(s)'.format(len(self.list_of_functions)))
-        function_counter = 0
-        for function in self.list_of_functions:
-            function_counter += 1
-            for constraint in function.list_of_constraints:
-                assert isinstance(constraint, Constraint)
-                if constraint.equality_or_inequality == 'inequality':
-                    constraints_list.append(self._expression_to_cvxpy(constraint.expression, F, G) <= 0)
-                elif constraint.equality_or_inequality == 'equality':
-                    constraints_list.append(self._expression_to_cvxpy(constraint.expression, F, G) == 0)
-                else:
-                    raise ValueError('The attribute \'equality_or_inequality\' of a constraint object'
-                                     ' must either be \'equality\' or \'inequality\'.'
-                                     'Got {}'.format(constraint.equality_or_inequality))
-            if verbose:
+            function_counter = 0
+            for function in self.list_of_functions:
+                function_counter += 1
                 print('\t\t function', function_counter, ':', len(function.list_of_constraints), 'constraint(s) added')
 
         # Defining lmi constraints
@@ -336,9 +384,11 @@ class PEP(object):
             print('(PEPit) Setting up the problem: {} lmi constraint(s) added'.format(len(self.list_of_psd)))
         for psd_counter, psd_matrix in enumerate(self.list_of_psd):
             M = cp.Variable(psd_matrix.shape, PSD=True)
-            for i in range(psd_matrix.shape[0]):
-                for j in range(psd_matrix.shape[1]):
-                    constraints_list.append(M[i, j] == self._expression_to_cvxpy(psd_matrix[i, j], F, G))
+            # All entries are matched at once, both sides being flattened in column-major order
+            size = psd_matrix.shape[0]
+            vectorized_M = cp.reshape(M, (size ** 2,), order='F')
+            entries = list(psd_matrix.flatten(order='F'))
+            constraints_list.append(vectorized_M == self._expressions_to_cvxpy(entries, F, G))
             if verbose:
                 print('\t\t Size of PSD matrix {}: {}x{}'.format(psd_counter+1, *psd_matrix.shape))
 
@@ -385,10 +435,16 @@ class PEP(object):
                 nb_eigenvalues, eig_threshold, corrected_G_value = self.get_nb_eigenvalues_and_corrected_matrix(G.value)
             elif dimension_reduction_heuristic.startswith("logdet"):
                 niter = int(dimension_reduction_heuristic[6:])
+
+                # The local approximation problems only differ by the weight matrix W.
+                # Hence, a single cvxpy Problem is built with W as a Parameter,
+                # and each solve is warm-started from the previous one.
+                W = cp.Parameter((Point.counter, Point.counter))
+                heuristic = cp.sum(cp.multiply(G, W))
+                prob = cp.Problem(objective=cp.Minimize(heuristic), constraints=constraints_list)
+                kwargs.setdefault("warm_start", True)
                 for i in range(1, 1+niter):
-                    W = np.linalg.inv(corrected_G_value + eig_regularization * np.eye(Point.counter))
-                    heuristic = cp.sum(cp.multiply(G, W))
-                    prob = cp.Problem(objective=cp.Minimize(heuristic), constraints=constraints_list)
+                    W.value = np.linalg.inv(corrected_G_value + eig_regularization * np.eye(Point.counter))
                     prob.solve(**kwargs)
 
                     # Print the estimated dimension after i dimension reduction steps
@@ -422,7 +478,7 @@ class PEP(object):
         self._eval_points_and_function_values(F.value, G.value, verbose=verbose)
 
         # Store all the dual values in constraints
-        self._eval_constraint_dual_values(prob.constraints)
+        self._eval_constraint_dual_values(performance_metric_constraint, constraint_blocks)
 
         # Return the value of the minimal performance metric or the full cvxpy Problem object
         if return_full_cvxpy_problem:
@@ -540,12 +596,15 @@ class PEP(object):
                                     "Expressions are made of function values, inner products and constants only!"
                                     "Got {}".format(type(sub_expression)))
 
-    def _eval_constraint_dual_values(self, cvx_constraints):
+    def _eval_constraint_dual_values(self, performance_metric_constraint, constraint_blocks):
         """
         Store all dual values in associated :class:`Constraint` objects.
 
         Args:
-            cvx_constraints (list): a list of cvxpy formatted constraints.
+            performance_metric_constraint (cvxpy Constraint): the cvxpy constraint bounding the objective
+                                                              by all the performance metrics.
+            constraint_blocks (list): a list of pairs made of a list of :class:`Constraint` objects
+                                      and of the cvxpy formatted vector constraint gathering them.
 
         Returns:
              position_of_minimal_objective (np.float): the position, in the list of performance metric,
@@ -553,26 +612,18 @@ class PEP(object):
 
         """
 
-        # Set counter
-        counter = len(self.list_of_performance_metrics)
-
         # The dual variables associated to performance metric all have nonnegative values of sum 1.
         # Generally, only 1 performance metric is used.
         # Then its associated dual values is 1 while the others'associated dual values are 0.
-        performance_metric_dual_values = np.array([constraint.dual_value for constraint in cvx_constraints[:counter]])
-        performance_metric_dual_values = performance_metric_dual_values.reshape(-1)
+        performance_metric_dual_values = np.array(performance_metric_constraint.dual_value).reshape(-1)
         position_of_minimal_objective = np.argmax(performance_metric_dual_values)
 
         # Store all dual values of initial conditions (Generally the rate)
-        for condition in self.list_of_constraints:
-            condition._dual_variable_value = cvx_constraints[counter].dual_value
-            counter += 1
-
-        # Store all the class constraints dual values, providing the proof of the desired rate.
-        for function in self.list_of_functions:
-            for constraint in function.list_of_constraints:
-                constraint._dual_variable_value = cvx_constraints[counter].dual_value
-                counter += 1
+        # and all the class constraints dual values, providing the proof of the desired rate.
+        for list_of_constraints, cvxpy_constraint in constraint_blocks:
+            dual_values = np.array(cvxpy_constraint.dual_value).reshape(-1)
+            for constraint, dual_value in zip(list_of_constraints, dual_values):
+                constraint._dual_variable_value = float(dual_value)
 
         # Return the position of the reached performance metric
         return position_of_minimal_objective
@@ -2,7 +2,7 @@ import numpy as np
 
 from PEPit.expression import Expression
 
-from PEPit.tools.dict_operations import merge_dict, prune_dict, multiply_dicts
+from PEPit.tools.dict_operations import merge_dict, subtract_dict, prune_dict, multiply_dicts
 
 
 class Point(object):
@@ -44,6 +44,12 @@ class Point(object):
         >>> point = Point()
         >>> new_expr = point ** 2
 
+    Or, equivalently, using the method `squared_norm`.
+
+    Example:
+        >>> point = Point()
+        >>> new_expr = point.squared_norm()
+
     """
 
     # Class counter.
@@ -148,8 +154,16 @@ class Point(object):
 
         """
 
-        # A-B = A+(-B)
-        return self.__add__(-other)
+        # Verify that other is a Point
+        assert isinstance(other, Point)
+
+        # Update the linear decomposition of the difference of 2 points from their respective leaf decomposition.
+        # This avoids creating the intermediate Point -B of A-B = A+(-B).
+        subtracted_decomposition_dict = subtract_dict(self.decomposition_dict, other.decomposition_dict)
+        subtracted_decomposition_dict = prune_dict(subtracted_decomposition_dict)
+
+        # Create and return the newly created Point that cannot be a leaf, by definition
+        return Point(is_leaf=False, decomposition_dict=subtracted_decomposition_dict)
 
     def __neg__(self):
         """
@@ -250,6 +264,33 @@ class Point(object):
         # Return the inner product of a point by itself
         return self.__rmul__(self)
 
+    def squared_norm(self):
+        """
+        Compute the squared norm of this :class:`Point`.
+
+        The decomposition is the same as the one of `self ** 2`:
+        each cross term :math:`c_a c_b` is stored on both keys :math:`(a, b)` and :math:`(b, a)`,
+        so that the coefficients applied to the Gram matrix remain symmetric.
+        Each product of coefficients is however computed once per unordered pair of leaf :class:`Point` objects.
+
+        Returns:
+            squared norm of self (Expression): same decomposition as `self ** 2`.
+
+        """
+
+        # Build the symmetric decomposition dict from the upper triangle of the outer product of the coefficients
+        decomposition_dict = dict()
+        items = list(self.decomposition_dict.items())
+        for i, (point1, weight1) in enumerate(items):
+            decomposition_dict[(point1, point1)] = weight1 ** 2
+            for point2, weight2 in items[i + 1:]:
+                product = weight1 * weight2
+                decomposition_dict[(point1, point2)] = product
+                decomposition_dict[(point2, point1)] = product
+
+        # Create and return the new expression
+        return Expression(is_leaf=False, decomposition_dict=decomposition_dict)
+
     def eval(self):
         """
         Compute, store and return the value of this :class:`Point`.
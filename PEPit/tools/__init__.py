@@ -1,7 +1,8 @@
-from .dict_operations import merge_dict, prune_dict, multiply_dicts
+from .dict_operations import merge_dict, subtract_dict, prune_dict, multiply_dicts
 
 __all__ = ['dict_operations',
            'merge_dict',
+           'subtract_dict',
            'prune_dict',
            'multiply_dicts',
            ]
@@ -32,6 +32,41 @@ def merge_dict(dict1, dict2):
     return merged_dict
 
 
+def subtract_dict(dict1, dict2):
+    """
+    Merge keys of dict1 and dict2.
+    If a key is in the 2 dictionaries, then subtract the value of dict2 from the value of dict1.
+    Keys of dict2 only are stored with the opposite of their value.
+
+    Args:
+        dict1 (dict): any dictionary
+        dict2 (dict): any dictionary
+
+    Returns:
+        subtracted_dict (dict): the union of the 2 inputs with subtracted values.
+
+    """
+
+    # Start from dict1
+    subtracted_dict = dict1.copy()
+
+    # Subtract all values of dict2 from dict1
+    for key in dict2.keys():
+
+        # If in both, the values are subtracted
+        if key in dict1.keys():
+
+            subtracted_dict[key] -= dict2[key]
+
+        # Otherwise, just add the new key and the opposite value
+        else:
+
+            subtracted_dict[key] = - dict2[key]
+
+    # Return the subtracted dict
+    return subtracted_dict
+
+
 def prune_dict(my_dict):
     """
     Remove all keys associated to a null value.
@@ -1,6 +1,6 @@
 import unittest
 
-from PEPit.tools.dict_operations import merge_dict, prune_dict, multiply_dicts
+from PEPit.tools.dict_operations import merge_dict, subtract_dict, prune_dict, multiply_dicts
 
 
 class TestDictOperations(unittest.TestCase):
@@ -15,6 +15,11 @@ class TestDictOperations(unittest.TestCase):
         summed_dict = {'a': 7, 'b': 14, 'q': 11, 'w': 0}
         self.assertEqual(merge_dict(dict1=self.dict1, dict2=self.dict2), summed_dict)
 
+    def test_subtract_dict(self):
+
+        subtracted_dict = {'a': 3, 'b': -2, 'q': 11, 'w': 0}
+        self.assertEqual(subtract_dict(dict1=self.dict1, dict2=self.dict2), subtracted_dict)
+
     def test_multiply_dicts(self):
 
         product_dict = {('a', 'a'): 10, ('a', 'b'): 40, ('a', 'w'): 0,
@@ -1,5 +1,6 @@
 import unittest
 import numpy as np
+import cvxpy as cp
 
 from PEPit.pep import PEP
 from PEPit.point import Point
@@ -82,6 +83,90 @@ class TestPEP(unittest.TestCase):
                                    2 * self.gamma * max(abs(1 - self.mu * self.gamma), abs(1 - self.L * self.gamma)),
                                    delta=2 * self.gamma * 10 ** 3)
 
+    def test_squared_norm(self):
+
+        # Overwrite initial condition and performance metric with squared_norm instead of ** 2
+        self.problem.list_of_constraints = [(self.x0 - self.xs).squared_norm() <= 1]
+        self.problem.list_of_performance_metrics = [(self.x1 - self.xs).squared_norm()]
+
+        pepit_tau = self.problem.solve(verbose=0)
+        self.assertAlmostEqual(pepit_tau, self.theoretical_tau, delta=self.theoretical_tau * 10 ** -3)
+
+        # The dual value of the initial condition is still the rate
+        self.assertAlmostEqual(self.problem.list_of_constraints[0]._dual_variable_value, pepit_tau,
+                               delta=pepit_tau * 10 ** -3)
+
+    def test_expressions_to_cvxpy(self):
+
+        # Define expressions mixing function values, inner products and constants
+        f0 = self.func.value(self.x0)
+        expressions = [f0,
+                       2 * f0 - 3 + self.x0 * self.xs,
+                       (self.x0 - self.xs) ** 2,
+                       ]
+
+        # Give arbitrary values to the cvxpy variables
+        F = cp.Variable((Expression.counter,))
+        G = cp.Variable((Point.counter, Point.counter))
+        F.value = np.arange(1, Expression.counter + 1, dtype=float)
+        G.value = np.arange(Point.counter ** 2, dtype=float).reshape(Point.counter, Point.counter)
+
+        # Compute the expected values from the decomposition of each expression
+        expected_values = list()
+        for expression in expressions:
+            if expression.get_is_leaf():
+                expected_values.append(F.value[expression.counter])
+            else:
+                value = 0
+                for key, weight in expression.decomposition_dict.items():
+                    if type(key) == Expression:
+                        value += weight * F.value[key.counter]
+                    elif type(key) == tuple:
+                        value += weight * G.value[key[0].counter, key[1].counter]
+                    else:
+                        value += weight
+                expected_values.append(value)
+
+        cvxpy_expressions = self.problem._expressions_to_cvxpy(expressions, F, G)
+        self.assertEqual(cvxpy_expressions.shape, (len(expressions),))
+        np.testing.assert_allclose(cvxpy_expressions.value, expected_values)
+
+    def test_eval_constraint_dual_values_mixed_constraints(self):
+
+        # Overwrite initial constraint by an inactive inequality followed by an equality
+        self.problem.list_of_constraints = [(self.x0 - self.xs) ** 2 <= 4, (self.x0 - self.xs) ** 2 == 1]
+
+        # Add a performance metric, never reached, before the actual one
+        self.problem.list_of_performance_metrics = [(self.x1 - self.xs) ** 2 + 1, (self.x1 - self.xs) ** 2]
+
+        prob = self.problem.solve(verbose=0, return_full_cvxpy_problem=True)
+        pepit_tau = prob.value
+        self.assertAlmostEqual(pepit_tau, self.theoretical_tau, delta=self.theoretical_tau * 10 ** -3)
+
+        # Only the second performance metric is reached
+        performance_metric_dual_values = prob.constraints[0].dual_value
+        self.assertAlmostEqual(performance_metric_dual_values[0], 0, delta=10 ** -3)
+        self.assertAlmostEqual(performance_metric_dual_values[1], 1, delta=10 ** -3)
+
+        # Dual values are stored in the constraints in order, whatever their type
+        inactive_inequality, equality = self.problem.list_of_constraints
+        self.assertIsInstance(inactive_inequality._dual_variable_value, float)
+        self.assertIsInstance(equality._dual_variable_value, float)
+        self.assertAlmostEqual(inactive_inequality._dual_variable_value, 0, delta=10 ** -3)
+        self.assertAlmostEqual(equality._dual_variable_value, pepit_tau, delta=pepit_tau * 10 ** -3)
+
+        self.assertEqual(len(self.func.list_of_constraints), 2)
+        for constraint in self.func.list_of_constraints:
+            self.assertIsInstance(constraint._dual_variable_value, float)
+            self.assertAlmostEqual(constraint._dual_variable_value,
+                                   2 * self.gamma * max(abs(1 - self.mu * self.gamma), abs(1 - self.L * self.gamma)),
+                                   delta=10 ** -3)
+
+    def test_no_performance_metric(self):
+
+        self.problem.list_of_performance_metrics = []
+        self.assertRaises(ValueError, self.problem.solve, verbose=0)
+
     def test_lmi_constraints(self):
 
         # Overwrite initial constraint
@@ -57,6 +57,19 @@ class TestPoint(unittest.TestCase):
                                                           (self.B, self.B): 1
                                                           })
 
+    def test_squared_norm(self):
+
+        norm_square = (self.A - self.B).squared_norm()
+
+        self.assertIsInstance(norm_square, Expression)
+        self.assertFalse(norm_square._is_leaf)
+        self.assertEqual(norm_square.decomposition_dict, {(self.A, self.A): 1,
+                                                          (self.A, self.B): -1,
+                                                          (self.B, self.A): -1,
+                                                          (self.B, self.B): 1
+                                                          })
+        self.assertEqual(norm_square.decomposition_dict, ((self.A - self.B) ** 2).decomposition_dict)
+
     def tearDown(self):
 
         Point.counter = 0
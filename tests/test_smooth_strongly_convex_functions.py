@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 
 from PEPit.point import Point
 from PEPit.expression import Expression
@@ -111,6 +112,88 @@ class TestConstraintsStronglyConvex(unittest.TestCase):
                                          + 1 / (2 * L) * (gi - gj) ** 2
                                          + mu / (2 * (1 - mu / L)) * (xi - xj - 1 / L * (gi - gj)) ** 2, 0)
 
+    def test_smooth_convex_constraints_drop_strong_convexity_term(self):
+
+        function = SmoothStronglyConvexFunction(L=self.L1, mu=0)
+
+        # Add points and constraints
+        function.oracle(self.point1)
+        function.oracle(self.point2)
+        function.add_class_constraints()
+        self.assertEqual(len(function.list_of_constraints), 2)
+
+        # Without strong convexity term, no inner product between the 2 points appears in the constraints
+        for constraint in function.list_of_constraints:
+            for key in constraint.expression.decomposition_dict:
+                if type(key) == tuple:
+                    self.assertFalse(key[0] in {self.point1, self.point2} and key[1] in {self.point1, self.point2})
+
+        # Give arbitrary values to the leaf points and function values
+        random_state = np.random.RandomState(0)
+        for point, gradient, function_value in function.list_of_points:
+            point._value = random_state.randn(Point.counter)
+            gradient._value = random_state.randn(Point.counter)
+            function_value._value = random_state.randn()
+
+        # The constraints have the same values as the full interpolation conditions with mu = 0
+        mu = 0
+        constraint_counter = 0
+        for i, point_i in enumerate(function.list_of_points):
+
+            xi, gi, fi = point_i
+
+            for j, point_j in enumerate(function.list_of_points):
+
+                xj, gj, fj = point_j
+
+                if i != j:
+                    full_constraint = (fi - fj >=
+                                       gj * (xi - xj)
+                                       + 1 / (2 * self.L1) * (gi - gj) ** 2
+                                       + mu / (2 * (1 - mu / self.L1)) * (xi - xj - 1 / self.L1 * (gi - gj)) ** 2)
+                    self.assertAlmostEqual(function.list_of_constraints[constraint_counter].expression.eval(),
+                                           full_constraint.expression.eval())
+                    constraint_counter += 1
+
+    def test_strongly_convex_constraints_match_interpolation_conditions(self):
+
+        # Add points and constraints
+        self.func1.oracle(self.point1)
+        self.func1.oracle(self.point2)
+        self.func1.add_class_constraints()
+
+        # The constraints have the same (symmetric in the Gram matrix) coefficients as the interpolation conditions
+        constraint_counter = 0
+        for i, point_i in enumerate(self.func1.list_of_points):
+
+            xi, gi, fi = point_i
+
+            for j, point_j in enumerate(self.func1.list_of_points):
+
+                xj, gj, fj = point_j
+
+                if i != j:
+                    full_constraint = (fi - fj >=
+                                       gj * (xi - xj)
+                                       + 1 / (2 * self.L1) * (gi - gj) ** 2
+                                       + self.mu1 / (2 * (1 - self.mu1 / self.L1))
+                                       * (xi - xj - 1 / self.L1 * (gi - gj)) ** 2)
+                    expected_dict = full_constraint.expression.decomposition_dict
+                    constraint_dict = self.func1.list_of_constraints[constraint_counter].expression.decomposition_dict
+                    self.assertEqual(set(constraint_dict.keys()), set(expected_dict.keys()))
+                    for key, weight in expected_dict.items():
+                        self.assertAlmostEqual(constraint_dict[key], weight)
+                    constraint_counter += 1
+
+    def test_no_constraint_when_mu_equals_L(self):
+
+        function = SmoothStronglyConvexFunction(L=self.L1, mu=self.L1)
+
+        # A single point leads to no pair of points, hence no interpolation constraint to compute
+        function.stationary_point()
+        function.add_class_constraints()
+        self.assertEqual(len(function.list_of_constraints), 0)
+
     def tearDown(self):
 
         Point.counter = 0